@@ -18,8 +18,8 @@ Practically anything that can be instantiated and implements attribute getters a
 should work as a configuration definition.
 """
 
-from functools import reduce
-from typing import Any, Callable, get_type_hints
+from abc import ABC
+from typing import Any, Callable, ClassVar, NoReturn, TypeVar, get_type_hints
 
 from mdtc.errors import (
     ConfigAttributeError,
@@ -28,6 +28,159 @@ from mdtc.errors import (
 )
 from mdtc.singleton import Singleton
 
+C = TypeVar("C", bound="Config")
+
+
+class ConfigModel(ABC):
+    """
+    Marks a class as a configuration model which `Config` will load.
+
+    Models either inherit from this class or are registered with it
+    (`ConfigModel.register(FooCfg)`), which suits dataclasses and Pydantic models alike.
+    For backwards compatibility, any class defining both `_key` and `_name` is still
+    treated as a model without doing either.
+    """
+
+    _key: ClassVar[str]
+    _name: ClassVar[str]
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> Any:
+        if cls is ConfigModel and hasattr(subclass, "_key") and hasattr(subclass, "_name"):
+            return True
+        return NotImplemented
+
+
+def _hints_for(cls: type) -> dict[str, Any]:
+    """
+    Resolve the type hints of a configuration class.
+
+    Models are normally annotated with the classes themselves, so the raw annotations along
+    the MRO suffice. `get_type_hints` (which evaluates stringified annotations) is only
+    used when a forward reference is present.
+    """
+    # Only called once per class, so keep `inspect` (and its `ast`/`dis` imports) out of
+    # `import mdtc`.
+    from inspect import get_annotations
+
+    hints: dict[str, Any] = {}
+    for klass in reversed(cls.__mro__):
+        hints.update(get_annotations(klass))
+
+    if any(isinstance(hint, str) for hint in hints.values()):
+        return get_type_hints(cls)
+    return hints
+
+
+def _implements_cfg(class_: Any) -> bool:
+    """Check if a given annotation is a model `Config` should load."""
+    try:
+        # The result is cached by `ABCMeta` per class after the first check.
+        return isinstance(class_, type) and issubclass(class_, ConfigModel)
+    except TypeError:
+        # Parametrised generics (e.g. `list[str]`) pass as types on python3.10.
+        return False
+
+
+def _models_for(cls: type) -> tuple[tuple[str, Any, str, tuple[str, ...]], ...]:
+    """
+    Collect the models declared on a configuration class.
+
+    Args:
+        cls (type): The class inheriting from `Config`.
+
+    Raises:
+        ConfigAttributeError: Raised when a model does not define `_name` or `_key`, or its
+        `_name` does not match the attribute defined inside the configuration class.
+
+    Returns:
+        tuple[tuple[str, Any, str, tuple[str, ...]], ...]: `(attribute, model, model._name,
+        model._key split into its segments)` for every model declared on the configuration class.
+    """
+    # Because defining a model in the config for typing purposes does not define a
+    # default value (and should not!), we read the annotations of the child class
+    # to retrieve this and check against what the model would have defined.
+
+    try:
+        annotations = _hints_for(cls)
+    except TypeError:
+        raise Exception("No configs defined!")
+
+    models = [(name, cls_) for name, cls_ in annotations.items() if _implements_cfg(cls_)]
+
+    if not models:
+        raise Exception("Configuration empty!")
+
+    # Models subclassing or registered with `ConfigModel` aren't guaranteed to define these.
+    for _, model in models:
+        for attr in ("_name", "_key"):
+            if not hasattr(model, attr):
+                raise ConfigAttributeError(
+                    f"The model - `{model.__name__}` is a `ConfigModel`, but it does not define"
+                    f" a `{attr}` attribute!"
+                )
+
+    bases = tuple(
+        (name, model, model._name, tuple(model._key.split("."))) for name, model in models
+    )
+
+    for name, base, base_name, _ in bases:
+        if name != base_name:
+            raise ConfigAttributeError(
+                f"The model - `{base.__name__}` says it's confobj key name is - `{base_name}`,"
+                f" but it has been declared as `{name}` inside `{cls.__name__}`!"
+            )
+
+    return bases
+
+
+def _key_not_found(model: Any) -> NoReturn:
+    """Raise the error for a model whose `_key` is missing from the configuration object."""
+    raise ConfigKeyNotFoundError(
+        f"The model - `{model.__name__}` asked to load a key - `{model._key}`"
+        " however the configuration does not contain such a key!"
+    )
+
+
+def _loader_for(cls: type) -> Callable[[Any, dict[str, Any]], None]:
+    """
+    Build a loader specialised to the models of a configuration class.
+
+    The attribute names, key segments and models are all known up-front, so rather than
+    looping over them on every instantiation, the loop is unrolled into generated source.
+    For a `misc: FooCfg` attribute with `_key = "config.misc"` the loader reads:
+
+        def load(self, config_object):
+            conf = config_object
+            conf = conf.get('config') if conf else None
+            conf = conf.get('misc') if conf else None
+            if not conf:
+                _key_not_found(model_0)
+            _setattr(self, 'misc', model_0(**conf))
+
+    Args:
+        cls (type): The class inheriting from `Config`.
+
+    Returns:
+        Callable[[Any, dict[str, Any]], None]: A function setting every model attribute of
+        an instance from the config dict.
+    """
+    namespace: dict[str, Any] = {"_key_not_found": _key_not_found, "_setattr": object.__setattr__}
+    source = ["def load(self, config_object):"]
+
+    for idx, (_, base, base_name, key_path) in enumerate(_models_for(cls)):
+        namespace[f"model_{idx}"] = base
+        source.append("    conf = config_object")
+        source.extend(f"    conf = conf.get({segment!r}) if conf else None" for segment in key_path)
+        source.append("    if not conf:")
+        source.append(f"        _key_not_found(model_{idx})")
+        # Let the model throw own error on instantiation..
+        source.append(f"    _setattr(self, {base_name!r}, model_{idx}(**conf))")
+
+    exec("\n".join(source), namespace)
+    loader: Callable[[Any, dict[str, Any]], None] = namespace["load"]
+    return loader
+
 
 class Config(Singleton):
     """
@@ -35,9 +188,17 @@ class Config(Singleton):
 
     At the same time, it enforces a pattern of defining your configuration via model-driven
     approach, where each key is a pre-defined and pre-typed model of your configuration.
+
+    The schema of a configuration is fixed, so subclasses may declare `__slots__` naming
+    their model attributes (e.g. `__slots__ = ("misc",)`) to drop the per-instance `__dict__`.
     """
 
-    __isfrozen: bool = False
+    __slots__ = ("__isfrozen",)
+
+    __isfrozen: bool
+
+    # The loader of a subclass, built on its first instantiation.
+    __loader: ClassVar[Callable[[Any, dict[str, Any]], None]]
 
     def __init__(self, config_object: dict[str, Any]) -> None:
         """
@@ -52,64 +213,69 @@ class Config(Singleton):
             ConfigKeyNotFoundError: Raised when a `_key` defined in the model is not found
             in the configuration object.
         """
-        # Because defining a model in the config for typing purposes does not define a
-        # default value (and should not!), we use `get_type_hints` to retrieve this
-        # from the child class and check against what the model would have defined.
-
-        try:
-            annotations = get_type_hints(self)
-        except TypeError:
-            raise Exception("No configs defined!")
-
-        bases = [(name, cls_) for name, cls_ in annotations.items() if self.__implements_cfg(cls_)]
+        # An already initialised (frozen) singleton is simply handed back as-is.
+        if getattr(self, "_Config__isfrozen", False):
+            return
 
-        if not bases:
-            raise Exception("Configuration empty!")
+        cls = type(self)
 
-        for name, base in bases:
-            if name != base._name:
-                raise ConfigAttributeError(
-                    f"The model - `{base.__name__}` says it's confobj key name is - `{base._name}`,"
-                    + f" but it has been declared as `{name}` inside `{self.__class__.__name__}`!"
-                )
-
-            if not (conf_dict := self.__get_cfg(base._key, config_object)):
-                raise ConfigKeyNotFoundError(
-                    f"The model - `{base.__name__}` asked to load a key - `{base._key}`"
-                    + " however the configuration does not contain such a key!"
-                )
+        try:
+            # Looked up in the class' own namespace so subclasses never reuse a parent's models.
+            if (load := cls.__dict__.get("_Config__loader")) is None:
+                cls.__loader = load = _loader_for(cls)
 
-            # Let the model throw own error on instantiation..
-            self.__setattr__(base._name, base(**conf_dict))
+            # The loader sets attributes via `object.__setattr__` - the frozen check in
+            # `__setattr__` is moot until the instance is frozen below.
+            load(self, config_object)
+        except Exception:
+            # `__new__` registered the instance already, don't leave it half-built for `get()`.
+            cls.clear_instance()
+            raise
 
         # Freeze the class instance
-        self.__isfrozen = True
+        object.__setattr__(self, "_Config__isfrozen", True)
 
     def __setattr__(self, attr: str, value: Any) -> None:
-        if self.__isfrozen:
+        if getattr(self, "_Config__isfrozen", False):
             raise FrozenConfigException("Can't mutate the config!")
         super().__setattr__(attr, value)
 
-    @staticmethod
-    def __implements_cfg(class_: Any) -> bool:
-        """Check if a given class uses `_key` and `_name` attributes as this class expects."""
-        return hasattr(class_, "_key") and hasattr(class_, "_name")
+    @classmethod
+    def get(cls: type[C], *args: Any, **kwargs: Any) -> C:
+        """
+        Return the initialised instance of this class, creating it on first use.
 
-    @staticmethod
-    def __get_cfg(key: str, cfg: dict[str, Any]) -> Any:
+        A registered instance which never got frozen (its construction raised, possibly
+        before `__init__` even ran) is discarded and the config is constructed anew.
         """
-        Deep "get" from a n-depth dictionary using a TOML notation key ([A.B..]).
+        instance = Singleton._instances.get(cls)
+        if isinstance(instance, cls) and getattr(instance, "_Config__isfrozen", False):
+            return instance
 
-        Args:
-            key (str): The TOML key for where the configuration is housed.
-            cfg (dict[str, Any]): The dictionary passed in to the config class.
+        cls.clear_instance()
+        return super().get(*args, **kwargs)
+
+    def __copy__(self) -> "Config":
+        """A singleton's copy is itself (copying state onto it would trip the frozen check)."""
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Config":
+        """A singleton's deep copy is itself, for the same reason as `__copy__`."""
+        return self
+
+    def __setstate__(self, state: Any) -> None:
+        """
+        Restore an unpickled config.
 
-        Returns:
-            Any: An applicable ANY-type value or None if key is not found.
+        Unpickling goes through `__new__`, so an already initialised singleton is handed back
+        untouched, otherwise its attributes are restored bypassing the frozen check.
         """
+        if getattr(self, "_Config__isfrozen", False):
+            return
 
-        reducer: Callable[..., Any] = lambda dict_, key: dict_.get(key) if dict_ else None
-        return reduce(reducer, key.split("."), cfg)
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        for attr, value in {**(dict_state or {}), **(slot_state or {})}.items():
+            object.__setattr__(self, attr, value)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(hash={self.__hash__()})>"
@@ -6,7 +6,9 @@
 """
 MDTC Singleton module.
 """
-from typing import Any
+from typing import Any, ClassVar, TypeVar, cast
+
+T = TypeVar("T", bound="Singleton")
 
 
 class Singleton:
@@ -17,15 +19,39 @@ class Singleton:
     to ever be allowed to exist in your program.
     """
 
+    # Instances are keyed on their exact class, so subclasses never share (or shadow)
+    # an instance of their parent and their own namespaces are left untouched.
+    _instances: ClassVar[dict[type, "Singleton"]] = {}
+
+    __slots__ = ()
+
     def __new__(cls, *args: Any, **kwargs: Any) -> "Singleton":
         """
         Intercept the `__new__` call and return an existing instance of this class instead.
         """
-        if not hasattr(cls, "instance"):
-            cls.instance = super(Singleton, cls).__new__(cls)
-        return cls.instance
+        if (instance := Singleton._instances.get(cls)) is None:
+            instance = Singleton._instances[cls] = super(Singleton, cls).__new__(cls)
+        return instance
+
+    @classmethod
+    def get(cls: type[T], *args: Any, **kwargs: Any) -> T:
+        """
+        Return the existing instance of this class, creating it on first use.
+
+        Once the instance exists this is a single registry lookup which, unlike calling
+        the class, skips `__new__` and `__init__` entirely. Any arguments are only used
+        to create the instance.
+        """
+        if (instance := Singleton._instances.get(cls)) is None:
+            try:
+                instance = cls(*args, **kwargs)
+            except BaseException:
+                # `__new__` registered the instance already, don't leave it half-built.
+                cls.clear_instance()
+                raise
+        return cast(T, instance)
 
     @classmethod
     def clear_instance(cls) -> None:
         """Destroys current instance and re-sets the singleton."""
-        del cls.instance
+        Singleton._instances.pop(cls, None)
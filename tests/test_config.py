@@ -3,6 +3,8 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 
+import copy
+import pickle
 from collections.abc import Generator
 from dataclasses import dataclass
 from pathlib import Path
@@ -12,7 +14,7 @@ import pytest
 import toml
 from pydantic import BaseModel
 
-from mdtc import Config
+from mdtc import Config, ConfigModel
 from mdtc.errors import (
     ConfigAttributeError,
     ConfigKeyNotFoundError,
@@ -53,6 +55,27 @@ class DCConfMismatched:
     _key: str = CONF_NAME_KEY_BAD
 
 
+@dataclass
+class DCConfExplicit(ConfigModel):
+    """Dataclass-based model explicitly marked as a config model."""
+
+    one: int
+    two: list[str]
+    three: dict[str, Any]
+
+    _name = CONF_NAME_KEY
+    _key = CONF_NAME_KEY
+
+
+@dataclass
+class DCConfUnnamed(ConfigModel):
+    """Dataclass-based model marked as a config model, but missing its `_name`."""
+
+    one: int
+
+    _key = CONF_NAME_KEY
+
+
 class PDConf(BaseModel):
     """Base pydantic-based model."""
 
@@ -92,6 +115,32 @@ class ConfigPD(Config):
     foo: PDConf
 
 
+class ConfigDCExplicit(Config):
+    """Dataclass-based config whose model inherits from `ConfigModel`"""
+
+    foo: DCConfExplicit
+
+
+class ConfigDCUnnamed(Config):
+    """Dataclass-based config whose `ConfigModel` model lacks a `_name`"""
+
+    foo: DCConfUnnamed
+
+
+class ConfigDCForwardRef(Config):
+    """Dataclass-based config which declares its model as a forward reference"""
+
+    foo: "DCConf"
+
+
+class ConfigDCSlotted(Config):
+    """Dataclass-based config which stores its model in a slot"""
+
+    __slots__ = ("foo",)
+
+    foo: DCConf
+
+
 # This will not match the model name and raise a model/conf mismatch error
 
 
@@ -130,6 +179,7 @@ Mismatches: TypeAlias = tuple[
     Type[ConfigPDMismatchedCoo],
 ]
 ConfigFixture: TypeAlias = Generator[tuple[RegularConfs, Mismatches], None, None]
+ClearFixture: TypeAlias = Generator[list[Type[Config]], None, None]
 
 #
 # Fixtures
@@ -158,6 +208,21 @@ def config_fixture() -> ConfigFixture:
     [cl.clear_instance() for cl in regular]
 
 
+@pytest.fixture
+def clear_fixture() -> ClearFixture:
+    """
+    Fixture returning a list the test appends the config classes it instantiates to.
+
+    Their singletons are re-set once the test finishes, even if it fails.
+    """
+
+    classes: list[Type[Config]] = []
+
+    yield classes
+
+    [cl.clear_instance() for cl in classes]
+
+
 #
 # Tests
 #
@@ -172,6 +237,77 @@ def test_cfg_as_expected(config_fixture: ConfigFixture) -> None:
     assert dcconf.foo.three == {"key": 3}  # type: ignore
 
 
+def test_cfg_reinstantiation(config_fixture: ConfigFixture) -> None:
+    """Test that instantiating an already initialised config returns it untouched."""
+    regular_configs, _ = config_fixture
+    dcconf = regular_configs[0]
+
+    assert ConfigDC(CONF_OBJ) is dcconf
+    assert ConfigDC({}) is dcconf
+    assert ConfigDC.get() is type(dcconf).get() is dcconf
+    assert dcconf.foo.one == 1  # type: ignore
+
+
+def test_cfg_copy_and_pickle(config_fixture: ConfigFixture) -> None:
+    """Test that copying or unpickling a config yields the singleton, frozen and populated."""
+    regular_configs, _ = config_fixture
+    dcconf, pdconf = regular_configs
+
+    assert type(dcconf) is ConfigDC
+    assert type(dcconf)(CONF_OBJ) is dcconf
+    assert copy.copy(dcconf) is copy.deepcopy(dcconf) is dcconf
+
+    # The pydantic model holds plain dicts, the `toml` inline tables can't be pickled.
+    data = pickle.dumps(pdconf)
+
+    assert pickle.loads(data) is pdconf
+
+    # Unpickling without a live instance (e.g. in another process) rebuilds it.
+    pdconf.clear_instance()
+    restored = pickle.loads(data)
+
+    assert restored is not pdconf
+    assert restored is ConfigPD(CONF_OBJ)
+    assert restored.foo == pdconf.foo
+
+    with pytest.raises(FrozenConfigException):
+        restored.foo = 22  # type: ignore
+
+
+def test_cfg_explicit_model(clear_fixture: list[Type[Config]]) -> None:
+    """Test that models marked via `ConfigModel` load like duck-typed ones."""
+    clear_fixture.extend((ConfigDCExplicit, ConfigDCUnnamed))
+    dcconf = ConfigDCExplicit(CONF_OBJ)
+
+    assert isinstance(dcconf.foo, DCConfExplicit)
+    assert dcconf.foo.two == ["one", "two"]
+    assert issubclass(DCConf, ConfigModel)
+    assert not issubclass(dict, ConfigModel)
+
+    with pytest.raises(ConfigAttributeError, match="`DCConfUnnamed`.*`_name`"):
+        ConfigDCUnnamed(CONF_OBJ)
+
+
+def test_cfg_forward_ref(clear_fixture: list[Type[Config]]) -> None:
+    """Test that a model declared as a string annotation is still resolved and loaded."""
+    clear_fixture.append(ConfigDCForwardRef)
+    dcconf = ConfigDCForwardRef(CONF_OBJ)
+
+    assert isinstance(dcconf.foo, DCConf)
+
+
+def test_cfg_slotted(clear_fixture: list[Type[Config]]) -> None:
+    """Test that a config declaring `__slots__` loads its models without a `__dict__`."""
+    clear_fixture.append(ConfigDCSlotted)
+    dcconf = ConfigDCSlotted(CONF_OBJ)
+
+    assert not hasattr(dcconf, "__dict__")
+    assert dcconf.foo.one == 1
+
+    with pytest.raises(FrozenConfigException):
+        dcconf.foo = 22  # type: ignore
+
+
 def test_frozen_configs_raise_error(config_fixture: ConfigFixture) -> None:
     """
     Test that trying to reassign the config model inside the Config class raises.
@@ -203,3 +339,31 @@ def test_cfg_attr_mismatch(config_fixture: ConfigFixture) -> None:
     for mismatch in mismatches[2:]:
         with pytest.raises(ConfigKeyNotFoundError):
             mismatch(CONF_OBJ)  # type: ignore
+
+
+def test_cfg_get_after_failed_init(clear_fixture: list[Type[Config]]) -> None:
+    """Test that a failed instantiation does not leave an instance behind for `get`."""
+    clear_fixture.append(ConfigDC)
+
+    with pytest.raises(ConfigKeyNotFoundError):
+        ConfigDC({})
+
+    dcconf = ConfigDC.get(CONF_OBJ)
+
+    assert dcconf.foo.one == 1  # type: ignore
+
+
+def test_cfg_get_after_missing_args(clear_fixture: list[Type[Config]]) -> None:
+    """Test that a call failing before `__init__` runs leaves nothing behind for `get`."""
+    clear_fixture.append(ConfigDC)
+
+    with pytest.raises(TypeError):
+        ConfigDC.get()
+
+    with pytest.raises(TypeError):
+        ConfigDC()  # type: ignore
+
+    dcconf = ConfigDC.get(CONF_OBJ)
+
+    assert dcconf.foo.one == 1  # type: ignore
+    assert ConfigDC.get() is dcconf
@@ -37,6 +37,47 @@ def test_singleton_props(get_foo: Iterable[tuple[Singleton, ...]]) -> None:
     assert inst_1.foo == inst_2.foo  # type: ignore
 
 
+def test_singleton_subclass_instance() -> None:
+    """Test that a subclass of a singleton does not reuse its parent's instance."""
+
+    class Foo(Singleton):
+        pass
+
+    class Bar(Foo):
+        pass
+
+    foo, bar = Foo(), Bar()
+
+    assert foo is Foo()
+    assert bar is Bar()
+    assert foo is not bar
+    assert type(bar) is Bar
+
+    foo.clear_instance()
+    bar.clear_instance()
+
+    assert Foo() is not foo
+
+
+def test_singleton_get() -> None:
+    """Test that `get` creates the instance once and returns it from then on."""
+
+    class Foo(Singleton):
+        def __init__(self, bar: int) -> None:
+            self.bar = bar
+
+    with pytest.raises(TypeError):
+        Foo.get()
+
+    try:
+        foo = Foo.get(10)
+
+        assert foo is Foo(20) is Foo.get()
+        assert foo.bar == 20
+    finally:
+        Foo.clear_instance()
+
+
 def test_singleton_method_super() -> None:
     """Test that overwriting or super on Singleton works as intended"""
 